@@ -4,11 +4,18 @@ from __future__ import annotations
 __all__: list[str] = []
 
 import random
+import socket
+import struct
 import threading
 import time
 import unittest
 from typing import cast
 
+try:
+    import msgspec # type: ignore
+except ImportError:
+    msgspec = None
+
 from pyserve import (Address, Client, ClientNotConnectedError, Packet,
                      PacketMalformedError, RequestManagerServer, Server,
                      ServerError, StrictPacket, load_protocol)
@@ -91,6 +98,21 @@ class CommsTest(unittest.TestCase):
                     self.assertEqual(data, packet)
                     packet["127"] += i
 
+    def test_requests_pipelined(self):
+
+        HOST = Address(HOST_IP, gport())
+        CLIENT = Address(TARGET_IP, gport())
+        server = TestServer(HOST)
+        client = TestClient(CLIENT)
+        packets = [SUPER_PACKET | {"id": i} for i in range(24)]
+
+        with server.operate():
+            time.sleep(DELAY)
+            with client.connect():
+                time.sleep(DELAY)
+                replies = client.request_many(packets)
+                self.assertEqual(replies, packets)
+
     def test_requests_diff(self):
 
         HOST = Address(HOST_IP, gport())
@@ -337,9 +359,35 @@ class RequestTest(unittest.TestCase):
                 time.sleep(DELAY)
                 client.send({"RequestType": "Test", "data": 1})
                 recv = client.recv()
-                del recv["addr"]
                 self.assertEqual(recv, {"RequestType": "Test", "data": 1})
 
+    def test_request_schema_trampoline(self):
+
+        HOST = Address(HOST_IP, gport())
+        CLIENT = Address(TARGET_IP, gport())
+        manager = RequestManagerServer(HOST, protocol=load_protocol(TEST_PROTOCOL))
+        manager.subscribe("Sum", lambda kw1, kw2: {"response": kw1 + kw2},
+                          schema=("kw1", "kw2"))
+        with manager.operate():
+            time.sleep(DELAY)
+            client = Client(CLIENT, protocol=load_protocol(TEST_PROTOCOL))
+            with client.connect():
+                time.sleep(DELAY)
+                client.send({"RequestType": "Sum", "kw1": 3, "kw2": 4, "extra": 0})
+                self.assertEqual(client.recv(), {"response": 7})
+
+    def test_request_schema_rejects_bad_field(self):
+
+        manager = RequestManagerServer(Address(HOST_IP, gport()),
+                                       protocol=load_protocol(TEST_PROTOCOL))
+        try:
+            with self.assertRaises(ValueError):
+                manager.subscribe("Bad", lambda **kwargs: kwargs, schema=("class",))
+            with self.assertRaises(ValueError):
+                manager.subscribe("Bad", lambda **kwargs: kwargs, schema=("not valid",))
+        finally:
+            manager.close()
+
     @staticmethod
     def log_and_add_request(packet) -> dict:
         kw1, kw2 = packet["kw1"], packet["kw2"]
@@ -381,6 +429,141 @@ class RequestTest(unittest.TestCase):
     def test_512x_request_response(self):
         self.n_request_test(512, 4)
 
+class FragmentationTest(unittest.TestCase):
+
+    def test_chunked_roundtrip(self):
+
+        # a 16-bit length field forces the chunked send/reassembly path
+        # without multi-gigabyte payloads
+        protocol = load_protocol("msgpack", byte_encoding_string=">HH", info_bytes=4)
+        packet = cast(StrictPacket, {"blob": "x" * 300_000, "tail": 1})
+        left, right = socket.socketpair()
+        try:
+            sender = threading.Thread(target=protocol.send_message, args=(left, packet))
+            sender.start()
+            received = protocol.recv_message(right)
+            sender.join()
+        finally:
+            left.close()
+            right.close()
+        self.assertEqual(received, packet)
+
+    def test_unchunked_roundtrip(self):
+
+        protocol = load_protocol("msgpack", byte_encoding_string=">HH", info_bytes=4)
+        packet = cast(StrictPacket, {"small": 1})
+        left, right = socket.socketpair()
+        try:
+            protocol.send_message(left, packet)
+            received = protocol.recv_message(right)
+        finally:
+            left.close()
+            right.close()
+        self.assertEqual(received, packet)
+
+    def test_garbage_chunk_header_rejected(self):
+
+        # a first header announcing ~4 TB of chunks must be treated as
+        # malformed, not allocated for
+        protocol = load_protocol("msgpack")
+        left, right = socket.socketpair()
+        try:
+            left.sendall(struct.pack(">LL", 1000, 2**32 - 1))
+            self.assertIsNone(protocol.recv_message(right))
+        finally:
+            left.close()
+            right.close()
+
+@unittest.skipIf(msgspec is None, "msgspec is not installed")
+class MsgspecTest(unittest.TestCase):
+
+    def test_request_response(self):
+
+        HOST = Address(HOST_IP, gport())
+        CLIENT = Address(TARGET_IP, gport())
+        packet = cast(StrictPacket, {"RequestType": "Test"} | SUPER_PACKET)
+        manager = RequestManagerServer(HOST, protocol=load_protocol("msgspec"))
+        manager.subscribe("Test", test_request)
+        with manager.operate():
+            time.sleep(DELAY)
+            client = Client(CLIENT, protocol=load_protocol("msgspec"))
+            with client.connect():
+                time.sleep(DELAY)
+                for _ in range(8):
+                    self.assertEqual(client.request(packet), packet)
+
+    def test_preference_sequence_fallback(self):
+
+        preferred = load_protocol(("not-a-protocol", "msgspec"))
+        self.assertIs(preferred, load_protocol("msgspec"))
+        with self.assertRaises(KeyError):
+            load_protocol(("not-a-protocol", "also-not-a-protocol"))
+
+    def test_schema_roundtrip(self):
+
+        class Ping(msgspec.Struct):
+            tag: str
+            value: int
+
+        HOST = Address(HOST_IP, gport())
+        CLIENT = Address(TARGET_IP, gport())
+        protocol = load_protocol("msgspec", schema=Ping)
+        server = Server(HOST, protocol=protocol, tickcallback=response)
+        client = Client(CLIENT, protocol=protocol)
+
+        with server.operate():
+            time.sleep(DELAY)
+            with client.connect():
+                time.sleep(DELAY)
+                client.send(cast(StrictPacket, {"tag": "ping", "value": 5}))
+                self.assertEqual(client.recv(), Ping("ping", 5))
+
+class ThreadedModeTest(unittest.TestCase):
+
+    """the retained reactor=False thread-per-connection fallback"""
+
+    @staticmethod
+    def make_server() -> Server:
+        return Server(Address(HOST_IP, gport()),
+                      protocol=load_protocol(TEST_PROTOCOL),
+                      tickcallback=response,
+                      reactor=False)
+
+    def test_request(self):
+
+        server = self.make_server()
+        client = TestClient(Address(TARGET_IP, gport()))
+        with server.operate():
+            time.sleep(DELAY)
+            with client.connect():
+                self.assertEqual(client.request(SUPER_PACKET), SUPER_PACKET)
+
+    def test_server_stable_after_bad_packet(self):
+
+        server = self.make_server()
+        clientbad = TestClient(Address(TARGET_IP, gport()))
+        clientworking = TestClient(Address(TARGET_IP, gport()))
+        with server.operate():
+            with clientbad.connect():
+                clientbad.sock.send(bytes([100, 4, 12, 42, 254, 1]))
+            time.sleep(DELAY)
+            with clientworking.connect():
+                self.assertEqual(clientworking.request(SUPER_PACKET), SUPER_PACKET)
+
+    def test_server_stable_after_garbage_chunk_header(self):
+
+        # the terabyte-scale chunk header, end to end in the mode where
+        # recv runs on a per-connection thread
+        server = self.make_server()
+        clientbad = TestClient(Address(TARGET_IP, gport()))
+        clientworking = TestClient(Address(TARGET_IP, gport()))
+        with server.operate():
+            with clientbad.connect():
+                clientbad.sock.send(struct.pack(">LL", 1000, 2**32 - 1))
+            time.sleep(DELAY)
+            with clientworking.connect():
+                self.assertEqual(clientworking.request(SUPER_PACKET), SUPER_PACKET)
+
 class ThreadTest(unittest.TestCase):
     def test_thread_count(self):
         #try:
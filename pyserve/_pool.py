@@ -0,0 +1,57 @@
+
+from __future__ import annotations
+
+__all__ = ["ConnectionPool", "CONNECTION_POOL"]
+
+import socket
+from collections import deque
+from threading import Lock
+
+from .address import RawAddress
+from .connection import Connection, Inbox
+from .socketprotocol import SocketProtocol
+
+POOL_CAP: int = 1024
+
+class ConnectionPool:
+
+    """Bounded free-list of Connection instances. Accept paths churn
+    through one Connection per client; recycling the instances keeps
+    allocator traffic flat across reconnect-heavy workloads.
+
+    Only closed connections that are no longer reachable through a
+    server's client table may be released - closed connections stay
+    addressable for Server.send until their slot is replaced
+    """
+
+    __slots__ = ("_free", "_lock", "cap")
+
+    def __init__(self, cap: int=POOL_CAP):
+        self._free: deque[Connection] = deque()
+        self._lock = Lock()
+        self.cap = cap
+
+    def acquire(self,
+            protocol: SocketProtocol,
+            connect: tuple[socket.socket, RawAddress],
+            queue: Inbox) -> Connection:
+        "return a recycled Connection re-initialised for connect, or a new one"
+        try:
+            with self._lock:
+                connection = self._free.popleft()
+        except IndexError:
+            return Connection(protocol, connect, queue)
+        connection.__init__(protocol, connect, queue)
+        return connection
+
+    def release(self, connection: Connection):
+        "recycle a closed connection unless the pool is already full"
+        if not connection.closed:
+            return
+        with self._lock:
+            if len(self._free) < self.cap:
+                self._free.append(connection)
+
+# shared across servers so short-lived servers (tests, benchmarks)
+# still see reuse
+CONNECTION_POOL = ConnectionPool()
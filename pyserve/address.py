@@ -3,25 +3,28 @@ from __future__ import annotations
 
 __all__ = ["Address", "RawAddress"]
 
-from dataclasses import astuple, dataclass, field
-from typing import cast
+from dataclasses import dataclass, field
 
 RawAddress = tuple[str, int]
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Address:
 
     """Encapsulated IP address. Can be converted to a RawAddress
-    with Address.astuple() or dataclasses.astuple(Address).
+    with Address.astuple().
     """
 
     addr: str=field(default="127.0.0.1")
     port: int=field(default=48_575)
+    _tuple: RawAddress=field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # frozen dataclass, so the cached tuple has to go in sideways
+        object.__setattr__(self, "_tuple", (self.addr, self.port))
 
     def astuple(self) -> RawAddress:
-        return cast(RawAddress, astuple(self))
+        return self._tuple
 
     @staticmethod
     def from_raw_address(raw_address: RawAddress) -> Address:
         return Address(raw_address[0], raw_address[1])
-
@@ -4,10 +4,10 @@ from __future__ import annotations
 __all__ = ["ClientNotConnectedError", "Client"]
 
 import socket
-from contextlib import suppress
 from enum import Enum
-from typing import cast
+from typing import Sequence, cast
 
+from ._sockopt import configure_socket
 from .address import Address
 from .socketprotocol import SocketProtocol, StrictPacket
 
@@ -57,6 +57,7 @@ class Client:
     ):
         self.__address = address
         self.__socket = socket.socket()
+        configure_socket(self.__socket)
         self.__protocol = protocol
         self.__state = ClientState.IDLE
         self.timeout = timeout
@@ -92,6 +93,20 @@ class Client:
         self.send(packet)
         return self.recv()
 
+    def request_many(self, packets: Sequence[StrictPacket]) -> list[StrictPacket]:
+        """Pipeline several requests over the connected connection:
+        send every packet first, then collect the responses in order.
+        One round-trip of latency is paid for the whole batch rather
+        than one per request
+
+        Raises:
+            ClientNotConnectedError:
+                when client is not connected
+        """
+        for packet in packets:
+            self.send(packet)
+        return [self.recv() for _ in packets]
+
     def send(self, packet: StrictPacket):
         """Send StrictPacket packet over connected connection
         
@@ -111,11 +126,11 @@ class Client:
                 when client is not connected
         """
         self._connected_check()
-        packet = None
-        while packet is None:
-            with suppress(ConnectionAbortedError, ConnectionResetError):
-                packet = self.protocol.recv_message(self.sock)
-            return cast(StrictPacket, packet)
+        try:
+            packet = self.protocol.recv_message(self.sock)
+        except (ConnectionAbortedError, ConnectionResetError):
+            packet = None
+        return cast(StrictPacket, packet)
 
     @property
     def address(self) -> Address:
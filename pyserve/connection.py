@@ -1,15 +1,60 @@
 
 from __future__ import annotations
 
-__all__ = ["Connection"]
+__all__ = ["Connection", "Inbox"]
 
 import socket
-from queue import Queue
+from collections import deque
+from threading import Event
 
 from .address import RawAddress
 from .socketprotocol import SocketProtocol, StrictPacket
 
 
+class Inbox:
+
+    """Multi-producer single-consumer channel between Connections and the
+    server tick thread. deque.append and popleft are atomic under the GIL
+    so producers never take a lock or signal a Condition per packet; the
+    Event only lifts the consumer out of an idle wait
+
+    Usage:
+        inbox.put(item)     // any producer thread
+        item = inbox.pop()  // consumer; raises IndexError when empty
+        inbox.wait(timeout) // consumer; idle until a put or timeout
+    """
+
+    __slots__ = ("_items", "_wake")
+
+    def __init__(self):
+        self._items = deque()
+        self._wake = Event()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put(self, item):
+        "append item and signal the consumer"
+        self._items.append(item)
+        # set() takes the Event's lock unconditionally; during a burst
+        # the flag is usually still up, so the flag read saves that
+        if not self._wake.is_set():
+            self._wake.set()
+
+    def pop(self):
+        "remove and return the oldest item, raising IndexError when empty"
+        return self._items.popleft()
+
+    def wait(self, timeout: float | None):
+        "block until a put arrives or timeout elapses"
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def wake(self):
+        "release a waiting consumer without queueing an item"
+        self._wake.set()
+
+
 class Connection:
     """Connection object that exists between a socket and a server.
     These are owned by a Server instance 
@@ -41,14 +86,21 @@ class Connection:
     -- timeout: amount of time before timeout triggered on a Connection
 
     """
-    def __init__(self, 
-            protocol: SocketProtocol, 
-            connect: tuple[socket.socket, RawAddress], 
-            queue: Queue):
+
+    __slots__ = ("protocol", "conn", "addr", "queue", "closed", "_send", "_recv")
+
+    def __init__(self,
+            protocol: SocketProtocol,
+            connect: tuple[socket.socket, RawAddress],
+            queue: Inbox):
         self.protocol = protocol
         self.conn, self.addr = connect
         self.queue = queue
         self.closed = False
+        # bound here so the per-packet paths reach the protocol
+        # callables through one attribute instead of two
+        self._send = protocol.send_message
+        self._recv = protocol.recv_message
 
     def __enter__(self):
         pass
@@ -63,7 +115,15 @@ class Connection:
         """
         if self.closed:
             return False
-        self.protocol.send_message(self.conn, packet)
+        try:
+            self._send(self.conn, packet)
+        except (ConnectionError, TimeoutError):
+            # the peer tore the connection down but its EOF has not been
+            # processed yet, or stopped draining its socket for the
+            # whole send timeout; report it like any other closed
+            # connection rather than letting it escape to the caller
+            self.close()
+            return False
         return True
 
     def close(self):
@@ -85,24 +145,34 @@ class Connection:
             # blocking_operate is True and then becomes false by now)
             return
         try:
-            data = self.protocol.recv_message(self.conn)
+            data = self._recv(self.conn)
         except (ConnectionAbortedError, ConnectionResetError, OSError):
             # if the connection dies during the transmission of this packet
-            # the connection is closed and a None is put on the Queue (to 
+            # the connection is closed and a None is put on the Queue (to
             # indicate that this connection's thread should end soon)
-            self.queue.put((self.addr, None), block=True)
+            # close before queueing so the tick thread cannot observe the
+            # death marker and still send into the dead socket
             self.close()
+            self.queue.put((self.addr, None))
             return
         if data is None:
             # if that packet was malformed, a None is returned
             # so we want to do the same here as with a connection
             # error
-            self.queue.put((self.addr, None), block=True)
             self.close()
+            self.queue.put((self.addr, None))
             return
         # valid data
-        self.queue.put((self.addr, data), block=True)
+        self.queue.put((self.addr, data))
 
     def blocking_operate(self):
         while not self.closed:
-            self.recv()
+            try:
+                self.recv()
+            except Exception:
+                # a protocol that chokes on garbage bytes must not end
+                # this thread with an unhandled traceback and a stale
+                # client-table entry; treat it like a dead connection,
+                # mirroring the reactor loop's backstop
+                self.close()
+                self.queue.put((self.addr, None))
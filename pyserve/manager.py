@@ -1,5 +1,9 @@
 
 from __future__ import annotations
+
+import inspect
+import keyword
+import sys
 import warnings
 
 from pyserve.client import Client, ClientNotConnectedError
@@ -19,16 +23,30 @@ class RequestManagerBase:
     _timeout: float
     _address: Address
     requests: dict[str, RequestFunction]
+    _frozen: tuple[tuple[str, RequestFunction], ...] | None
+
+    # above this many subscriptions a dict lookup beats a linear scan,
+    # so freeze() refuses to build the identity table
+    FREEZE_SCAN_MAX: int = 16
 
     def __init__(self, *, request_header_string: str="RequestType"):
         self._request_header_string = request_header_string
         self.requests = {}
+        self._frozen = None
 
-    def subscribe(self, request_name: str, function: RequestFunction):
+    def subscribe(self, request_name: str, function: RequestFunction, *, schema=None):
         """Add the given requestName and function to the list of valid requests
-        and will call function whenever a request of type requestName is given.
-        Note that the function given *must* return a dict that can be serialised
-        by the protocol given.
+        and will call function(packet, addr) whenever a request of type
+        requestName is given. Note that the function given *must* return a dict
+        that can be serialised by the protocol given. Functions taking only the
+        packet are still accepted; the sender address is simply not passed
+        (checked once here, not per dispatch).
+
+        When schema is given - a sequence of field names, or a class whose
+        __annotations__ name the fields (a TypedDict, say) - a trampoline is
+        generated that extracts exactly those fields and calls
+        function(field=packet[field], ...) as keyword arguments, skipping the
+        packet dict handling entirely inside the handler.
 
         Raises:
             KeyError:
@@ -38,7 +56,14 @@ class RequestManagerBase:
         if request_name in self.requests:
             raise KeyError(f"Cannot subscribe function {function} to name {request_name} because "
                            f"the name is already used")
-        self.requests[request_name] = function
+        if schema is not None:
+            function = _make_trampoline(function, _schema_keys(schema))
+        elif not _accepts_addr(function):
+            packet_only = function
+            function = cast(RequestFunction, lambda packet, addr: packet_only(packet))
+            function.__wrapped__ = packet_only # type: ignore[attr-defined]
+        self.requests[sys.intern(request_name)] = function
+        self._frozen = None
 
     def unsubscribe(self, request_name: str, function: RequestFunction):
         """Removes the requestName from the list of valid requests. If a function
@@ -55,23 +80,49 @@ class RequestManagerBase:
         """
         if request_name not in self.requests:
             raise KeyError(f"Cannot unsubscribe name {request_name} as it is not subscribed")
-        if function is None or function == self.requests[request_name]:
+        subscribed = self.requests[request_name]
+        if function is None or function == subscribed \
+                or function == getattr(subscribed, "__wrapped__", None):
             del self.requests[request_name]
+            self._frozen = None
         else:
             raise ValueError(f"Optional function {function} check does not match the function "
                              f"{self.requests[request_name]} for request name {request_name}")
 
-    def post(self, request_name: str, packet: StrictPacket) -> Packet:
-        """Posts request requestName with the data obtained from a packet sent
-        as Kwargs to the subscribed function. 
+    def freeze(self):
+        """Snapshot the subscription table for dispatch by string identity.
+        Subscribed names are interned, so once the incoming header is also
+        interned a small frozen table can be scanned with `is` comparisons
+        and skip hashing entirely. Tables larger than FREEZE_SCAN_MAX
+        snapshot empty and stay on dict dispatch where hashing wins.
+        post() rebuilds the snapshot lazily on the first dispatch after
+        subscribe or unsubscribe invalidates it
         """
+        if len(self.requests) <= self.FREEZE_SCAN_MAX:
+            self._frozen = tuple(self.requests.items())
+        else:
+            self._frozen = ()
+
+    def post(self, request_name: str, packet: StrictPacket, addr: Address) -> Packet:
+        """Posts request requestName, handing the subscribed function the
+        decoded packet and the address it came from.
+        """
+        table = self._frozen
+        if table is None:
+            self.freeze()
+            table = self._frozen
+        for name, function in table:
+            if name is request_name:
+                return function(packet, addr)
         if request_name not in self.requests:
             return None
-        return self.requests[request_name](packet)
+        return self.requests[request_name](packet, addr)
 
 
 class RequestManagerServer(RequestManagerBase, Server):
-    
+
+    _header_key: str
+
     def __init__(self, address: Address, *,
                 protocol: SocketProtocol,
                 request_header_string: str="RequestType",
@@ -84,6 +135,9 @@ class RequestManagerServer(RequestManagerBase, Server):
                 timeout=timeout
             )
         RequestManagerBase.__init__(self, request_header_string=request_header_string)
+        # interned once so dispatch neither calls the property nor
+        # re-interns the key per packet
+        self._header_key = sys.intern(self._request_header_string)
 
     def reply(self, client: Address, response: StrictPacket):
         try:
@@ -95,14 +149,51 @@ class RequestManagerServer(RequestManagerBase, Server):
     def _handle_request(server: RequestManagerServer, addr: Address, packet: Packet):
         if packet is None:
             return
-        header = cast(str, packet[server.request_header_string])
-        packet["addr"] = cast(list, addr)
-        resp = server.post(header, packet)
-        server.reply(addr, cast(StrictPacket, resp))
+        header = sys.intern(cast(str, packet[server._header_key]))
+        server.reply(addr, cast(StrictPacket, server.post(header, packet, addr)))
 
     @property
     def request_header_string(self) -> str:
         return self._request_header_string
    
 
-RequestFunction = Callable[[Packet], StrictPacket]
+RequestFunction = Callable[[Packet, Address], StrictPacket]
+
+def _accepts_addr(function: Callable) -> bool:
+    "whether function can be called with (packet, addr)"
+    try:
+        inspect.signature(function).bind(None, None)
+    except TypeError:
+        return False
+    return True
+
+def _schema_keys(schema) -> list[str]:
+    """Field names named by a schema: the schema itself if it is a
+    sequence of names, else its __annotations__ keys
+
+    Raises:
+        ValueError:
+            when a field name is not a valid identifier (the names are
+            compiled into a trampoline)
+    """
+    keys = list(getattr(schema, "__annotations__", None) or schema)
+    for key in keys:
+        # iskeyword too: "class".isidentifier() is True but would leave
+        # subscribe() as a SyntaxError out of the trampoline compile
+        if not isinstance(key, str) or not key.isidentifier() \
+                or keyword.iskeyword(key):
+            raise ValueError(f"Schema field {key!r} is not a valid identifier")
+    return keys
+
+def _make_trampoline(function: Callable, keys: list[str]) -> RequestFunction:
+    """Compile a dispatch trampoline specialised to a fixed keyset, so a
+    schema'd handler receives exactly its fields as keyword arguments
+    rather than walking the packet dict itself
+    """
+    args = ", ".join(f"{key}=packet[{key!r}]" for key in keys)
+    source = f"def trampoline(packet, addr):\n    return function({args})\n"
+    namespace = {"function": function}
+    exec(compile(source, "<pyserve.manager.trampoline>", "exec"), namespace)
+    trampoline = namespace["trampoline"]
+    trampoline.__wrapped__ = function
+    return cast(RequestFunction, trampoline)
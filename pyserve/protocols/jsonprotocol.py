@@ -1,7 +1,7 @@
 
 import json
 
-from .plugin import SocketProtocol, malformed_packet_wrap
+from .plugin import SocketProtocol
 
 DefaultArgs = {
     "header_length":12,
@@ -10,5 +10,5 @@ DefaultArgs = {
 }
 
 class Plugin(SocketProtocol):
-    send_message = malformed_packet_wrap(json.dumps)
-    recv_message = malformed_packet_wrap(json.loads)
+    send_message = json.dumps
+    recv_message = json.loads
@@ -1,13 +1,18 @@
 
 import msgpack # type: ignore
 
-from .plugin import SocketProtocol, malformed_packet_wrap
+from .plugin import SocketProtocol
 
 DefaultArgs = {
     "byte_encoding_string":">LL",
     "info_bytes":8
 }
 
+# one Packer reused for every packet; msgpack.dumps constructs a fresh
+# Packer (and its internal buffer) per call. Exposed unwrapped: the
+# protocol closures translate codec errors to PacketMalformedError
+_packer = msgpack.Packer()
+
 class Plugin(SocketProtocol):
-    send_message = malformed_packet_wrap(msgpack.dumps)
-    recv_message = malformed_packet_wrap(msgpack.loads)
+    send_message = _packer.pack
+    recv_message = msgpack.loads
@@ -0,0 +1,47 @@
+
+import msgspec # type: ignore
+
+from .plugin import SocketProtocol
+
+DefaultArgs = {
+    "byte_encoding_string":">LL",
+    "info_bytes":8
+}
+
+# one Encoder/Decoder pair reused for every packet; re-entering
+# msgspec.msgpack.encode would rebuild codec state per call
+_encoder = msgspec.msgpack.Encoder()
+_decoder = msgspec.msgpack.Decoder()
+
+class Plugin(SocketProtocol):
+    send_message = _encoder.encode
+    recv_message = _decoder.decode
+
+def load(*, schema: type | None=None, **kwargs) -> SocketProtocol:
+    """Build the msgspec protocol, taking over from the generic binary
+    factory so load_protocol("msgspec", schema=T) reaches the
+    schema-compiled fast path
+    """
+    if schema is not None:
+        return schema_protocol(schema)
+    from ..socketprotocol import make_binary_protocol
+    return make_binary_protocol(
+        encode_function=_encoder.encode,
+        decode_function=_decoder.decode,
+        **{**DefaultArgs, **kwargs}
+    )
+
+def schema_protocol(schema: type) -> SocketProtocol:
+    """Build a binary msgspec protocol specialised to one Struct schema,
+    suitable for the protocol kwarg of Client and Server. Packets with a
+    fixed shape skip per-field dynamic typing because the Decoder is
+    compiled against the schema once and reused for every packet
+    """
+    # deferred: socketprotocol executes this module while it is itself
+    # still initialising
+    from ..socketprotocol import make_binary_protocol
+    return make_binary_protocol(
+        encode_function=_encoder.encode,
+        decode_function=msgspec.msgpack.Decoder(schema).decode,
+        **DefaultArgs
+    )
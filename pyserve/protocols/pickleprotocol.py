@@ -1,13 +1,27 @@
 
 import pickle
+from functools import partial
+from warnings import warn
 
-from .plugin import SocketProtocol, malformed_packet_wrap
+from .plugin import SocketProtocol
 
 DefaultArgs = {
     "byte_encoding_string":">LL",
     "info_bytes":8
 }
 
+# without an explicit protocol, dumps may emit an older, larger and
+# slower wire format; pin the newest one (peers all run this module, so
+# there is no cross-version stream to stay compatible with)
+try:
+    import _pickle
+except ImportError:
+    _pickle = None
+
+if _pickle is None or pickle.Pickler is not _pickle.Pickler:
+    warn("C pickle accelerator (_pickle) is not in use; the pickle "
+         "protocol will run on the pure-Python implementation")
+
 class Plugin(SocketProtocol):
-    send_message = malformed_packet_wrap(pickle.dumps)
-    recv_message = malformed_packet_wrap(pickle.loads)
+    send_message = partial(pickle.dumps, protocol=pickle.HIGHEST_PROTOCOL)
+    recv_message = pickle.loads
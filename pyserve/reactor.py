@@ -0,0 +1,112 @@
+
+from __future__ import annotations
+
+__all__ = ["Reactor"]
+
+import os
+import selectors
+import threading
+from contextlib import suppress
+from typing import Callable
+
+from .connection import Connection
+
+SELECT_TIMEOUT: float = 0.05
+
+class Reactor:
+
+    """Readiness multiplexer that drives many Connections from a single
+    thread. One submission (the selector registration) delivers many
+    completions (readable events), so the server pays one waiting thread
+    total rather than one blocked thread per client
+
+    Usage:
+        reactor = Reactor()
+        reactor.register(connection)
+        reactor.run(lambda: server.closed) // on a dedicated thread
+
+    Connections whose sockets become readable have their recv() called on
+    the reactor thread, which puts packets on the server's queue exactly
+    as the thread-per-connection path does
+    """
+
+    def __init__(self):
+        self._selector = selectors.DefaultSelector()
+        self._register_lock = threading.Lock()
+        self._closed = False
+        # self-pipe so register() can interrupt an in-flight select();
+        # without it a fresh connection waits out the full select timeout
+        # before its first packet is seen
+        self._wakeup_recv, self._wakeup_send = os.pipe()
+        os.set_blocking(self._wakeup_recv, False)
+        os.set_blocking(self._wakeup_send, False)
+        self._selector.register(self._wakeup_recv, selectors.EVENT_READ, None)
+
+    def register(self, connection: Connection):
+        """Start watching a connection's socket for readability.
+        Safe to call from the accept thread while run() is selecting
+        """
+        with self._register_lock:
+            if self._closed:
+                return
+            try:
+                self._selector.register(connection.conn, selectors.EVENT_READ, connection)
+            except KeyError:
+                # the kernel reused a closed connection's fd number before
+                # the reactor reaped its stale registration (closed fds
+                # never fire events, so reaping only happens here); drop
+                # the stale entry and retry
+                self._selector.unregister(connection.conn)
+                self._selector.register(connection.conn, selectors.EVENT_READ, connection)
+            with suppress(OSError, BlockingIOError):
+                os.write(self._wakeup_send, b"\0")
+
+    def close(self):
+        """Release the selector and the wakeup pipe. Called by run() on
+        the way out and by servers whose reactor thread never started;
+        safe to call more than once
+        """
+        with self._register_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._selector.close()
+            os.close(self._wakeup_recv)
+            os.close(self._wakeup_send)
+
+    def unregister(self, connection: Connection):
+        """Stop watching a connection's socket. Silently ignores sockets
+        that were never registered or whose fd has already been closed
+        """
+        with self._register_lock:
+            if self._closed:
+                return
+            with suppress(KeyError, ValueError, OSError):
+                self._selector.unregister(connection.conn)
+
+    def run(self, closed: Callable[[], bool]):
+        """Select over every registered connection until closed() is True,
+        dispatching recv() for each readable socket
+        """
+        while not closed():
+            events = self._selector.select(timeout=SELECT_TIMEOUT)
+            for key, _ in events:
+                connection: Connection = key.data
+                if connection is None:
+                    # wakeup pipe; drain whatever register() wrote
+                    with suppress(OSError, BlockingIOError):
+                        while os.read(self._wakeup_recv, 4096):
+                            pass
+                    continue
+                if not connection.closed:
+                    try:
+                        connection.recv()
+                    except Exception:
+                        # a protocol that chokes on garbage bytes must not
+                        # take the reactor (and every other connection)
+                        # down with it; treat it like a dead connection
+                        connection.close()
+                        connection.queue.put((connection.addr, None))
+                if connection.closed:
+                    self.unregister(connection)
+        self.close()
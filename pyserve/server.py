@@ -5,18 +5,23 @@ __all__ = ["Server", "ServerState", "ServerError", "TickCallBack"]
 
 import socket
 import threading
-import time
+from collections import deque
 from contextlib import suppress
 from enum import Enum
-from queue import Queue
 from typing import Callable, Generator
 
-from .address import Address
+from ._pool import CONNECTION_POOL
+from ._sockopt import configure_socket
+from .address import Address, RawAddress
 from .call import call
-from .connection import Connection
+from .connection import Connection, Inbox
+from .reactor import Reactor
 from .socketprotocol import Packet, SocketProtocol, StrictPacket
 
 
+# power of two so the shard index is a mask of the address hash
+CLIENT_SHARDS: int = 16
+
 class ServerError(Exception):
     pass
 
@@ -51,7 +56,13 @@ class Server:
     -- protocol: determines how to serialise and deserialise packets\n
     -- timeout: amount of time before timeout triggered on a Connection\n
     -- tickcallback: function(server: Server, addr: Address, packet: StrictPacket)\n
-    -- delay: time.sleep delay between polls
+    -- delay: upper bound on an idle tick's wait; 0 (the default) waits
+    until work arrives\n
+    -- reactor: multiplex all connections on one reactor thread (the
+    default) instead of spawning a thread per connection\n
+    -- batch_max: most packets handled per tick before yielding\n
+    -- tcp_nodelay: disable Nagle's algorithm on accepted sockets (the
+    default; framed request/reply traffic stalls behind it)
 
     Raises:
         ServerError:
@@ -63,34 +74,47 @@ class Server:
     _protocol: SocketProtocol
     _socket: socket.socket
     _state: ServerState
-    _tickcallback: tuple[TickCallBack]
-    _client_dict_lock: threading.Lock
-    _clients: dict[Address, Connection]
-    _queue: Queue[tuple[Address, Packet]]
+    _tickcb: TickCallBack
+    _client_shards: list[dict[Address, Connection]]
+    _client_locks: list[threading.Lock]
+    _queue: Inbox
     _threads: list[threading.Thread]
-    _unjoined: list[threading.Thread]
-    _unjoined_lock: threading.Lock
+    _unjoined: deque[threading.Thread]
+    _running_wake: threading.Event
+    _reactor: Reactor | None
     delay: float
+    batch_max: int
+    tcp_nodelay: bool
 
-    def __init__(self, address: Address, *, 
+    def __init__(self, address: Address, *,
                 protocol: SocketProtocol,
                 tickcallback: TickCallBack,
                 timeout: float=10.,
-                delay: float=0.000
+                delay: float=0.000,
+                reactor: bool=True,
+                batch_max: int=64,
+                tcp_nodelay: bool=True
     ):
         self.__address = address
         self._protocol = protocol
         self._socket = socket.socket()
         self._state = ServerState.IDLE
-        self._tickcallback = (tickcallback,)
-        self._client_dict_lock = threading.Lock()
-        self._clients = {}
-        self._queue = Queue()
+        self._tickcb = tickcallback
+        # the connection table is sharded so concurrent senders to
+        # different clients do not serialise on one global lock
+        self._client_shards = [{} for _ in range(CLIENT_SHARDS)]
+        self._client_locks = [threading.Lock() for _ in range(CLIENT_SHARDS)]
+        self._queue = Inbox()
         self._threads = []
-        self._unjoined = []
-        self._unjoined_lock = threading.Lock()
+        # deque append/popleft are atomic under the GIL, so finished
+        # connection threads hand themselves over without a lock
+        self._unjoined = deque()
+        self._running_wake = threading.Event()
+        self._reactor = Reactor() if reactor else None
         self._timeout = timeout
         self.delay = delay
+        self.batch_max = batch_max
+        self.tcp_nodelay = tcp_nodelay
         self._connect()
         
     def __repr__(self) -> str:
@@ -112,6 +136,8 @@ class Server:
         self._operate_check()
         if self.state == ServerState.IDLE:
             self._nonblocking_accept_clients()
+            if self._reactor is not None:
+                self._start_thread(lambda: self._reactor.run(lambda: self.closed))
         self._blocking_operate()
 
     def operate(self) -> Server:
@@ -124,8 +150,7 @@ class Server:
         """
         self._operate_check()
         self._start_thread(self.blocking_operate)
-        while not self.running:
-            time.sleep(self.delay)
+        self._running_wake.wait()
         return self
 
     def send(self, address: Address, packet: StrictPacket):
@@ -138,8 +163,9 @@ class Server:
             KeyError:
                 when there is no client at Address address
         """
-        with self._client_dict_lock:
-            self._clients[address].send(packet)
+        clients, lock = self._shard(address)
+        with lock:
+            clients[address].send(packet)
 
     def close(self):
         """Set server state to closed, tell all connections to close,
@@ -147,11 +173,25 @@ class Server:
         """
         self._state = ServerState.CLOSED
         self.sock.close()
-        clients = list(self._clients.values())
+        # lift the tick thread out of its idle wait so it can observe
+        # the closed state; producers are gone, so nothing else will
+        self._queue.wake()
+        clients = [conn for shard in self._client_shards for conn in shard.values()]
         for conn in clients:
             conn.close()
         for thread in self._get_threads():
             thread.join()
+        if self._reactor is not None:
+            # a no-op when the reactor thread ran (run() closes on exit),
+            # but a server closed without operating still holds the
+            # selector and wakeup-pipe fds
+            self._reactor.close()
+        # every worker referencing these connections has been joined, so
+        # they can go back to the pool for the next server
+        for shard in self._client_shards:
+            shard.clear()
+        for conn in clients:
+            CONNECTION_POOL.release(conn)
 
     @property
     def address(self) -> Address:
@@ -180,7 +220,15 @@ class Server:
 
     @property
     def tickcallback(self) -> TickCallBack:
-        return self._tickcallback[0]
+        return self._tickcb
+
+    @property
+    def _clients(self) -> dict[Address, Connection]:
+        "merged snapshot of every shard, for iteration and introspection"
+        merged: dict[Address, Connection] = {}
+        for shard in self._client_shards:
+            merged.update(shard)
+        return merged
 
     @property
     def closed(self) -> bool:
@@ -197,34 +245,51 @@ class Server:
             self.sock.settimeout(self.timeout)
         except (OSError, TypeError) as e:
             self.sock.close()
+            if self._reactor is not None:
+                self._reactor.close()
             raise ServerError(f"Server {self} ({self.__class__.__qualname__}) failed to bind to {self.address}\n"
                               f"Raised exception `{e}`")
 
+    def _shard(self, address: Address) -> tuple[dict[Address, Connection], threading.Lock]:
+        "the shard dict and lock owning address's table slot"
+        index = hash(address) & (CLIENT_SHARDS - 1)
+        return self._client_shards[index], self._client_locks[index]
+
     def _operate_check(self) -> bool:
         if self.closed or self.running:
             raise ServerError(f"Server {self} in state {self.state} cannot be operated on")
         return True
 
     def _tick(self):
-        if not self._queue.empty():
-            # although Queue.empty() does not guarantee that Queue.get()
-            # returns a value threadsafely, no other thread is using Queue.get()
-            # and so this is actually threadsafe anyway
-            addr, packet = self._queue.get(block=True)
-            self.tickcallback(self, addr, packet)
-        else:
+        pop = self._queue.pop
+        try:
+            addr, packet = pop()
+        except IndexError:
             # on an empty tick, join closed connection threads if there
             # exists any to join
-            if len(self._unjoined) > 0:
-                with self._unjoined_lock:
-                    for thread in self._unjoined:
-                        thread.join()
-                    self._unjoined = []
+            if self._unjoined:
+                while True:
+                    try:
+                        thread = self._unjoined.popleft()
+                    except IndexError:
+                        break
+                    thread.join()
             else:
                 # if nothing at all has been done this tick on this thread,
-                # wait for the set delay time to help the scheduler
-                # (best performance comes from having no delay, however)
-                time.sleep(self.delay)
+                # idle until a producer signals the inbox (or close()
+                # wakes it); delay caps the wait when one is configured
+                self._queue.wait(self.delay or None)
+            return
+        # drain up to batch_max packets per tick so a burst pays for one
+        # pass through the loop machinery, not one per packet
+        tickcallback = self._tickcb
+        tickcallback(self, addr, packet)
+        for _ in range(self.batch_max - 1):
+            try:
+                addr, packet = pop()
+            except IndexError:
+                return
+            tickcallback(self, addr, packet)
 
     def _nonblocking_connect(self, connection: Connection):
         self._start_thread(lambda: self._blocking_connect(connection))
@@ -239,16 +304,58 @@ class Server:
 
     def _blocking_operate(self):
         self._state = ServerState.RUNNING
-        while not self.closed:
-            self._tick()
+        self._running_wake.set()
+        # the loop runs once per wake at minimum and once per packet at
+        # most; locals skip the closed/state property chain each time
+        tick = self._tick
+        closed = ServerState.CLOSED
+        while self._state is not closed:
+            tick()
 
     def _accept_clients(self):
         while not self.closed:
             with suppress(socket.timeout, OSError):
-                connection = Connection(self.protocol, self.sock.accept(), self._queue)
-                with self._client_dict_lock:
-                    self._clients[connection.addr] = connection
-                self._nonblocking_connect(connection)
+                self._admit_client(self.sock.accept())
+                # a connection stampede queues further clients behind the
+                # one just taken; drain the whole backlog now rather than
+                # paying one blocking accept per client
+                self.sock.settimeout(0)
+                try:
+                    while not self.closed:
+                        try:
+                            connect = self.sock.accept()
+                        except BlockingIOError:
+                            break
+                        self._admit_client(connect)
+                finally:
+                    with suppress(OSError):
+                        self.sock.settimeout(self.timeout)
+
+    def _admit_client(self, connect: tuple[socket.socket, RawAddress]):
+        configure_socket(connect[0], nodelay=self.tcp_nodelay)
+        if self._reactor is not None:
+            # every recv on the reactor thread stalls every other
+            # connection, and a peer that sends part of a frame and goes
+            # quiet would stall it forever; a timeout bounds the stall
+            # and drops the offender. Threaded connections stay
+            # timeout-free - their recv legitimately blocks between
+            # messages on a dedicated thread
+            connect[0].settimeout(self._timeout)
+        connection = CONNECTION_POOL.acquire(self.protocol, connect, self._queue)
+        clients, lock = self._shard(connection.addr)
+        with lock:
+            # a reconnecting address displaces its stale entry, but the
+            # displaced connection must not go back to the pool here:
+            # its recv thread may still be blocked inside recv, and a
+            # recycled, re-__init__'d instance would make that thread's
+            # error path close the new socket and enqueue a death marker
+            # under the new address. Dropping it for the GC is safe;
+            # only close(), after joining every worker, releases
+            clients[connection.addr] = connection
+        if self._reactor is not None:
+            self._reactor.register(connection)
+        else:
+            self._nonblocking_connect(connection)
 
     def _get_threads(self) -> Generator[threading.Thread, None, None]:
         yield from self._threads